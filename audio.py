@@ -0,0 +1,128 @@
+import hashlib
+import os
+import queue
+import tempfile
+import threading
+import time
+
+import pygame
+
+
+class AudioPlayer:
+    # Low latency sound playback. Sounds are decoded once into PCM and cached
+    # on disk, and every play request is handed to a worker thread so the
+    # render thread and the GPIO callback never wait on the mixer.
+    CLICK_CHANNEL = 0
+
+    def __init__(self, frequency=44100, size=-16, channels=2, buffer=256, cache_dir=os.path.join("cache", "sound")):
+        # pre_init must run before init, a small buffer keeps latency down
+        pygame.mixer.pre_init(frequency, size, channels, buffer)
+        pygame.mixer.init()
+        self.mixer_format = pygame.mixer.get_init()
+        self.buffer = buffer
+        self.buffer_latency = buffer / self.mixer_format[0]
+        # Reserve a channel for clicks, Sound.play() never picks it, and
+        # playing a new click on it cuts the previous one instead of stacking
+        pygame.mixer.set_reserved(self.CLICK_CHANNEL + 1)
+        self.click_channel = pygame.mixer.Channel(self.CLICK_CHANNEL)
+        self.cache_dir = cache_dir
+        self.sounds = {}
+        self.latencies = []
+        self.requests = queue.Queue()
+        self.worker = threading.Thread(target=self._run, daemon=True)
+        self.worker.start()
+        print(f"[Audio] mixer {self.mixer_format}, buffer {buffer} samples ({self.buffer_latency * 1000:.1f} ms)")
+
+    def _cache_path(self, path):
+        # Raw PCM depends on the mixer format, so it is part of the key
+        with open(path, "rb") as f:
+            digest = hashlib.sha1(f.read()).hexdigest()
+        frequency, size, channels = self.mixer_format
+        return os.path.join(self.cache_dir, f"{digest}_{frequency}_{size}_{channels}.pcm")
+
+    def load(self, name, path, volume=1.0):
+        if not os.path.exists(path):
+            print(f"[Audio] {path} not found")
+            return None
+        cache_path = self._cache_path(path)
+        pcm = self._read_cache(cache_path)
+        if pcm is not None:
+            sound = pygame.mixer.Sound(buffer=pcm)
+        else:
+            sound = pygame.mixer.Sound(path)
+            self._write_cache(cache_path, sound.get_raw())
+        sound.set_volume(volume)
+        self.sounds[name] = sound
+        return sound
+
+    def _read_cache(self, cache_path):
+        if not os.path.exists(cache_path):
+            return None
+        with open(cache_path, "rb") as f:
+            pcm = f.read()
+        # A file that is not a whole number of sample frames is damaged,
+        # decode the source again instead of playing a clipped sound
+        _, size, channels = self.mixer_format
+        frame_size = channels * abs(size) // 8
+        if not pcm or len(pcm) % frame_size:
+            print(f"[Audio] Ignoring damaged cache {cache_path}")
+            return None
+        return pcm
+
+    def _write_cache(self, cache_path, pcm):
+        # Write to a temporary file and rename it, so an interrupted write
+        # never leaves a truncated file under the cache key
+        temp_path = None
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(pcm)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            print(f"[Audio] Failed to cache {cache_path}: {e}")
+            if temp_path and os.path.exists(temp_path):
+                os.unlink(temp_path)
+
+    def play(self, name):
+        self.requests.put((name, False, None))
+
+    def play_click(self, name, requested_at=None):
+        # requested_at is the time.perf_counter() of the input event
+        if requested_at is None:
+            requested_at = time.perf_counter()
+        self.requests.put((name, True, requested_at))
+
+    def _run(self):
+        while True:
+            name, is_click, requested_at = self.requests.get()
+            if name is None:
+                return
+            sound = self.sounds.get(name)
+            if sound is None:
+                continue
+            # Keep the worker alive through mixer errors, otherwise every
+            # later request would pile up in the queue unplayed
+            try:
+                if is_click:
+                    self.click_channel.play(sound)
+                    self._record_latency(requested_at)
+                else:
+                    sound.play()
+            except pygame.error as e:
+                print(f"[Audio] Failed to play {name}: {e}")
+
+    def _record_latency(self, requested_at):
+        # Time until the mixer has the sound, plus one buffer until it is heard
+        latency = time.perf_counter() - requested_at + self.buffer_latency
+        self.latencies.append(latency)
+        self.latencies = self.latencies[-50:]
+        average = sum(self.latencies) / len(self.latencies)
+        print(f"[Audio] press to sound {latency * 1000:.1f} ms (average {average * 1000:.1f} ms)")
+
+    def stop(self):
+        self.requests.put((None, False, None))
+        self.worker.join()
+        pygame.mixer.quit()
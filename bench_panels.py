@@ -0,0 +1,113 @@
+import argparse
+import importlib.util
+import os
+import sys
+import threading
+import time
+
+# What this measures, and what it does not:
+# - Rendering is per-panel work. Each panel shows its own scene, so its item
+#   pastes and RGB565 conversion scale linearly. Shared precomputation
+#   (sprites, timelines, rotated background) is paid once at startup and
+#   only keeps the per-panel cost low, it does not make rendering sub-linear.
+# - Only the SPI transfers are sub-linear, and only when the panels are on
+#   separate SPI controllers (e.g. spidev0.0 and spidev1.0). Devices on one
+#   controller (spidev0.0 and spidev0.1) are serialized by the kernel, which
+#   the "one controller" case models with a shared bus lock.
+
+# lumon-ui.py is a script with a dash in its name, load it as a module
+spec = importlib.util.spec_from_file_location("lumon_ui", os.path.join(os.path.dirname(os.path.abspath(__file__)), "lumon-ui.py"))
+lumon_ui = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(lumon_ui)
+
+
+class StandInDisplay:
+    # Display backend without hardware, draw_image optionally sleeps to
+    # stand in for the SPI transfer of one frame. Displays sharing bus_lock
+    # transfer one at a time, like devices on one SPI controller
+    LCD_WIDTH = 240
+    LCD_HEIGHT = 280
+
+    def __init__(self, transfer_ms=0, bus_lock=None):
+        self.transfer_seconds = transfer_ms / 1000
+        self.bus_lock = bus_lock or threading.Lock()
+        self.frames = 0
+
+    def draw_image(self, x, y, width, height, pixel_data):
+        if self.transfer_seconds:
+            with self.bus_lock:
+                time.sleep(self.transfer_seconds)
+        self.frames += 1
+
+    def set_backlight(self, brightness):
+        pass
+
+    def set_rgb(self, r, g, b):
+        pass
+
+    def set_rgb_fade(self, r_target, g_target, b_target, duration_ms=100):
+        pass
+
+
+def measure(panel_count, sprites, frames, transfer_ms, one_controller=False):
+    bus_lock = threading.Lock() if one_controller else None
+    displays = [StandInDisplay(transfer_ms, bus_lock) for _ in range(panel_count)]
+    render_thread = lumon_ui.RenderThread(displays, sprites, None)
+    try:
+        # Warm up the sprite caches before timing
+        for _ in range(10):
+            render_thread.render_frame()
+        start = time.perf_counter()
+        for frame in range(frames):
+            render_thread.render_frame()
+            for scene in render_thread.scenes:
+                scene.tick(frame + 1, render_thread.fps)
+        elapsed = time.perf_counter() - start
+    finally:
+        render_thread.executor.shutdown(wait=True)
+    assert all(display.frames == frames + 10 for display in displays)
+    return elapsed / frames * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Frame time of RenderThread with 1 vs N stand-in panels")
+    parser.add_argument("--panels", type=int, default=4)
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--transfer-ms", type=float, default=20, help="Simulated SPI transfer time per frame and panel")
+    parser.add_argument("--font", default=lumon_ui.FONT_PATH)
+    args = parser.parse_args()
+
+    sprites = lumon_ui.SpriteCache(args.font)
+    cases = [
+        ("render only", 0, False),
+        ("separate controllers", args.transfer_ms, False),
+        ("one controller", args.transfer_ms, True),
+    ]
+    results = {}
+    for name, transfer_ms, one_controller in cases:
+        single_ms = measure(1, sprites, args.frames, transfer_ms)
+        multi_ms = measure(args.panels, sprites, args.frames, transfer_ms, one_controller)
+        results[name] = (single_ms, multi_ms)
+        print(
+            f"[Bench] {name} (transfer {transfer_ms:g} ms): 1 panel {single_ms:.1f} ms/frame, "
+            f"{args.panels} panels {multi_ms:.1f} ms/frame ({multi_ms / single_ms:.2f}x)"
+        )
+
+    failed = False
+    # Rendering is expected to be linear, the multi-panel path must not add
+    # overhead on top of the per-panel work
+    single_ms, multi_ms = results["render only"]
+    if multi_ms > single_ms * args.panels * 1.15:
+        print("[Bench] Rendering costs more than linear in panel count")
+        failed = True
+    # Transfers on separate controllers must overlap
+    single_ms, multi_ms = results["separate controllers"]
+    if multi_ms >= single_ms * args.panels:
+        print("[Bench] Transfers on separate controllers do not overlap")
+        failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
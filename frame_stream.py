@@ -0,0 +1,300 @@
+import os
+import socket
+import stat
+import struct
+import threading
+import time
+import zlib
+
+import numpy as np
+
+# Stream protocol
+# Connection: HELLO = magic, version, width, height, tile size
+# Each frame: FRAME header followed by payload_length bytes of payload,
+# zlib compressed when FLAG_ZLIB is set. The payload is a list of changed
+# tiles, each one tile_x (u8), tile_y (u8) and the tile's big-endian RGB565
+# rows. Tiles at the right/bottom edge are cropped to the screen size.
+MAGIC = b"WPLY"
+VERSION = 1
+TILE_SIZE = 16
+HELLO = struct.Struct("<4sBHHB")
+FRAME = struct.Struct("<IdHBI")  # frame id, timestamp, tile count, flags, payload length
+TILE_HEADER = struct.Struct("<BB")
+FLAG_ZLIB = 1
+FLAG_KEYFRAME = 2
+
+
+def parse_address(address):
+    # "HOST:PORT" (or ":PORT") for TCP, anything else is a Unix socket path
+    host, separator, port = address.rpartition(":")
+    if separator and port.isdigit():
+        return socket.AF_INET, (host or "0.0.0.0", int(port))
+    return socket.AF_UNIX, address
+
+
+def _is_socket(path):
+    try:
+        return stat.S_ISSOCK(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return False
+
+
+def _as_array(pixel_data):
+    if isinstance(pixel_data, (bytes, bytearray, memoryview)):
+        return np.frombuffer(pixel_data, dtype=np.uint8)
+    return np.asarray(pixel_data, dtype=np.uint8).ravel()
+
+
+class FrameStreamer:
+    # Frame sink for WhisplayBoard.draw_image that streams the screen to one
+    # viewer. submit() only hands the frame over; diffing, compression and
+    # sending run on a worker thread. While the viewer is slow, newer frames
+    # replace the pending one instead of queueing up.
+    def __init__(self, address, width, height, compress=True, compress_level=1):
+        self.width = width
+        self.height = height
+        self.compress = compress
+        self.compress_level = compress_level
+        self.tile_columns = (width + TILE_SIZE - 1) // TILE_SIZE
+        self.tile_rows = (height + TILE_SIZE - 1) // TILE_SIZE
+        # Screen as the render loop drew it, and as the viewer last received it
+        self.framebuffer = np.zeros((height, width * 2), dtype=np.uint8)
+        self.reference = None
+        # False until a full frame arrived for the current viewer, frames are
+        # skipped while nobody watches so the framebuffer may be stale
+        self.framebuffer_valid = False
+        self.changed = np.zeros((self.tile_rows * TILE_SIZE, self.tile_columns * TILE_SIZE * 2), dtype=bool)
+        self.frame_id = 0
+
+        self.lock = threading.Lock()
+        self.frame_ready = threading.Event()
+        self.pending = []
+        self.connected = False
+        self.incoming_client = None
+        self.client = None
+        self.running = True
+
+        self.bytes_sent = 0
+        self.frames_sent = 0
+        self.frames_dropped = 0
+        self.stats_started = time.time()
+
+        family, self.address = parse_address(address)
+        if family == socket.AF_UNIX and os.path.exists(self.address):
+            # Only replace a stale socket, never a file given by mistake
+            if not _is_socket(self.address):
+                raise ValueError(f"{self.address} exists and is not a socket, not streaming to it")
+            os.unlink(self.address)
+        self.server = socket.socket(family, socket.SOCK_STREAM)
+        if family == socket.AF_INET:
+            self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server.bind(self.address)
+        self.server.listen(1)
+        self.family = family
+
+        self.accept_thread = threading.Thread(target=self._accept_loop, daemon=True)
+        self.encode_thread = threading.Thread(target=self._encode_loop, daemon=True)
+        self.accept_thread.start()
+        self.encode_thread.start()
+        print(f"[Stream] Listening on {address}")
+
+    def submit(self, x, y, width, height, pixel_data):
+        if not self.connected:
+            return
+        with self.lock:
+            if x == 0 and y == 0 and width == self.width and height == self.height:
+                # A full frame supersedes everything the worker has not sent yet
+                if self.pending:
+                    self.frames_dropped += 1
+                self.pending = []
+            self.pending.append((x, y, width, height, pixel_data))
+        self.frame_ready.set()
+
+    def _accept_loop(self):
+        while self.running:
+            try:
+                client, _ = self.server.accept()
+            except OSError:
+                return
+            try:
+                if self.family == socket.AF_INET:
+                    client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                client.settimeout(2)
+                client.sendall(HELLO.pack(MAGIC, VERSION, self.width, self.height, TILE_SIZE))
+            except OSError:
+                client.close()
+                continue
+            print("[Stream] Viewer connected")
+            # The encode thread owns the client, hand the new one over
+            with self.lock:
+                if self.incoming_client:
+                    self.incoming_client.close()
+                self.incoming_client = client
+                self.connected = True
+            self.frame_ready.set()
+
+    def _encode_loop(self):
+        while self.running:
+            if self.frame_ready.wait(0.5):
+                self.frame_ready.clear()
+            # Keep serving through a bad frame, otherwise the thread dies
+            # silently while submit() keeps accepting frames
+            try:
+                self._encode_pending()
+            except Exception as e:
+                print(f"[Stream] Failed to encode frame: {e}")
+                self.reference = None  # resync the viewer with a keyframe
+            self._report()
+
+    def _encode_pending(self):
+        with self.lock:
+            pending, self.pending = self.pending, []
+            if self.incoming_client:
+                if self.client:
+                    self.client.close()
+                self.client = self.incoming_client
+                self.incoming_client = None
+                # New viewer needs a keyframe, held back until a fresh full frame
+                self.reference = None
+                self.framebuffer_valid = False
+        for x, y, width, height, pixel_data in pending:
+            region = _as_array(pixel_data).reshape(height, width * 2)
+            self.framebuffer[y : y + height, x * 2 : (x + width) * 2] = region
+            if x == 0 and y == 0 and width == self.width and height == self.height:
+                self.framebuffer_valid = True
+        if self.client and pending and self.framebuffer_valid:
+            message = self._encode()
+            if message:
+                self._send(message)
+
+    def _encode(self):
+        keyframe = self.reference is None
+        if keyframe:
+            tiles = [(ty, tx) for ty in range(self.tile_rows) for tx in range(self.tile_columns)]
+        else:
+            np.not_equal(self.framebuffer, self.reference, out=self.changed[: self.height, : self.width * 2])
+            changed_tiles = self.changed.reshape(
+                self.tile_rows, TILE_SIZE, self.tile_columns, TILE_SIZE * 2
+            ).any(axis=(1, 3))
+            tiles = np.argwhere(changed_tiles)
+            if len(tiles) == 0:
+                return None
+
+        parts = []
+        for ty, tx in tiles:
+            parts.append(TILE_HEADER.pack(tx, ty))
+            tile = self.framebuffer[
+                ty * TILE_SIZE : (ty + 1) * TILE_SIZE, tx * TILE_SIZE * 2 : (tx + 1) * TILE_SIZE * 2
+            ]
+            parts.append(tile.tobytes())
+        payload = b"".join(parts)
+
+        flags = FLAG_KEYFRAME if keyframe else 0
+        if self.compress:
+            payload = zlib.compress(payload, self.compress_level)
+            flags |= FLAG_ZLIB
+        if self.reference is None:
+            self.reference = self.framebuffer.copy()
+        else:
+            np.copyto(self.reference, self.framebuffer)
+        self.frame_id += 1
+        return FRAME.pack(self.frame_id, time.time(), len(tiles), flags, len(payload)) + payload
+
+    def _send(self, message):
+        try:
+            self.client.sendall(message)
+        except OSError:
+            print("[Stream] Viewer disconnected")
+            self.client.close()
+            self.client = None
+            with self.lock:
+                self.connected = self.incoming_client is not None
+            return
+        self.bytes_sent += len(message)
+        self.frames_sent += 1
+
+    def _report(self):
+        now = time.time()
+        elapsed = now - self.stats_started
+        if elapsed < 1:
+            return
+        if self.client:
+            print(
+                f"[Stream] {self.bytes_sent / elapsed / 1024:.1f} KB/s, "
+                f"{self.frames_sent / elapsed:.1f} fps sent, {self.frames_dropped} dropped"
+            )
+        self.bytes_sent = 0
+        self.frames_sent = 0
+        self.frames_dropped = 0
+        self.stats_started = now
+
+    def stop(self):
+        self.running = False
+        # shutdown() wakes the blocking accept(), close() alone may not
+        try:
+            self.server.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.server.close()
+        self.accept_thread.join()
+        self.frame_ready.set()
+        self.encode_thread.join()
+        with self.lock:
+            if self.incoming_client:
+                self.incoming_client.close()
+                self.incoming_client = None
+            self.connected = False
+        if self.client:
+            self.client.close()
+            self.client = None
+        if self.family == socket.AF_UNIX and _is_socket(self.address):
+            os.unlink(self.address)
+
+
+class FrameStreamDecoder:
+    # Client side of the stream, keeps the viewer's copy of the screen
+    def __init__(self, sock):
+        self.sock = sock
+        magic, version, self.width, self.height, self.tile_size = HELLO.unpack(self._recv_exact(HELLO.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a Whisplay frame stream")
+        self.framebuffer = np.zeros((self.height, self.width * 2), dtype=np.uint8)
+
+    def _recv_exact(self, size):
+        data = bytearray()
+        while len(data) < size:
+            chunk = self.sock.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError("Stream closed")
+            data.extend(chunk)
+        return bytes(data)
+
+    def read_frame(self):
+        # Apply the next frame, returns (frame id, timestamp, message size)
+        frame_id, timestamp, tile_count, flags, payload_length = FRAME.unpack(self._recv_exact(FRAME.size))
+        payload = self._recv_exact(payload_length)
+        if flags & FLAG_ZLIB:
+            payload = zlib.decompress(payload)
+        offset = 0
+        for _ in range(tile_count):
+            tx, ty = TILE_HEADER.unpack_from(payload, offset)
+            offset += TILE_HEADER.size
+            x0 = tx * self.tile_size
+            y0 = ty * self.tile_size
+            tile_width = min(self.tile_size, self.width - x0)
+            tile_height = min(self.tile_size, self.height - y0)
+            size = tile_width * tile_height * 2
+            tile = np.frombuffer(payload, dtype=np.uint8, count=size, offset=offset)
+            self.framebuffer[y0 : y0 + tile_height, x0 * 2 : (x0 + tile_width) * 2] = tile.reshape(
+                tile_height, tile_width * 2
+            )
+            offset += size
+        return frame_id, timestamp, FRAME.size + payload_length
+
+    def to_rgb(self):
+        pixels = self.framebuffer.view(">u2").astype(np.uint16)
+        rgb = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        rgb[..., 0] = ((pixels >> 11) & 0x1F) << 3
+        rgb[..., 1] = ((pixels >> 5) & 0x3F) << 2
+        rgb[..., 2] = (pixels & 0x1F) << 3
+        return rgb
@@ -6,30 +6,150 @@ import time
 import sys
 import threading
 import random
-import pygame
 import signal
 import math
-from whisplay import WhisplayBoard
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 from utils import ColorUtils, ImageUtils, TextUtils
+from timeline import Timeline, ease_out_cubic
+from audio import AudioPlayer
+from frame_stream import FrameStreamer
+
+FONT_PATH = "NotoSansSC-Bold.ttf"
+
+# The layout below is in landscape scene coordinates at twice the panel
+# resolution. Sprites, lid lines and flight paths are rotated into the
+# portrait 240x280 panel once, so frames are drawn in panel orientation and
+# need no per-frame rotate/resize
+SCENE_WIDTH = 560
+SCENE_HEIGHT = 480
+PANEL_SIZE = (SCENE_HEIGHT // 2, SCENE_WIDTH // 2)
+
+# 50 150 260 370 480
+COLLECT_X = [50, 150, 260, 370, 480]
+COLLECT_Y = 380
+
+# Layout of the number matrix in scene coordinates
+MATRIX_POSITION = (24, 106)
+MATRIX_COLUMNS = 12
+MATRIX_LINES = 6
+MATRIX_ITEM_SIZE = 40
+MATRIX_SPACING = 4
+
+# Animation timings in seconds (30 fps frame counts in comments)
+COLLECT_DURATION = 1 / 3  # Numbers fly into the bin in 10 frames
+LID_KEYFRAMES = [(0, 0), (1 / 6, 90), (2 / 3, 90), (5 / 6, 0)]  # Open in 5 frames, close by frame 25
+LOGO_SLIDE_DURATION = 2
+
+CLOCK_POSITION = (100, 170)
+CLOCK_SIZE = (370, 150)
+
+BOX_TOPS = [
+    [(20, 400), (103, 400)],
+    [(130, 400), (212, 400)],
+    [(238, 403), (320, 403)],
+    [(348, 400), (430, 400)],
+    [(457, 400), (540, 400)],
+]
+
+def to_panel_point(point):
+    # Rotate a scene point 90 degrees clockwise and halve it
+    x, y = point
+    return ((SCENE_HEIGHT - 1 - y) // 2, x // 2)
+
+def to_panel_position(position, size):
+    # Panel top-left of a scene sprite at position with the given size
+    x, y = position
+    width, height = size
+    return ((SCENE_HEIGHT - y - height) // 2, x // 2)
+
+def to_panel_sprite(image):
+    rotated = image.rotate(-90, expand=True)
+    return rotated.resize((max(1, rotated.width // 2), max(1, rotated.height // 2)), Image.BILINEAR)
+
+def to_panel_lines(lines):
+    if lines is None:
+        return None
+    return tuple(tuple(to_panel_point(point) for point in line) for line in lines)
+
+class SpriteCache:
+    # Sprites shared by every panel driven from this process, so a second
+    # panel reuses the glyphs and clock overlay rendered for the first one.
+    # Item and clock sprites are stored in panel orientation
+    def __init__(self, font_path):
+        self.font = ImageFont.truetype(font_path, 20)
+        self.clock_font = ImageFont.truetype(font_path, 60)
+        self.title_font = ImageFont.truetype(font_path, 32)
+        self.number_image_cache = {}
+        self.item_image_cache = {}
+        self.last_time_str = ""
+        self.clock_image = None
+
+    def render_font_image(self, number):
+        if number in self.number_image_cache:
+            return self.number_image_cache[number]
+
+        text_bbox = self.font.getbbox(str(number))
+        text_width = text_bbox[2] - text_bbox[0]
+        text_height = text_bbox[3] - text_bbox[1]
+        font_image = Image.new("RGBA", (text_width, text_height + 20), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(font_image)
+        draw.text((0, 0), str(number), font=self.font, fill=(170, 250, 255, 255))
+        # Cache the font image, key is the number
+        self.number_image_cache[number] = font_image
+        return font_image
+
+    def get_item_image(self, number, scale, item_width, item_height):
+        cache_key = (number, int(scale * 100))
+        if cache_key in self.item_image_cache:
+            return self.item_image_cache[cache_key]
+
+        img = Image.new("RGBA", (item_width, item_height), (0, 0, 0, 0))
+        font_image = self.render_font_image(number)
+        scaled_width = int(font_image.width * scale)
+        scaled_height = int(font_image.height * scale)
+
+        if scaled_width > 0 and scaled_height > 0:
+            scaled_font_image = font_image.resize((scaled_width, scaled_height), Image.BILINEAR)
+            img.paste(scaled_font_image, ((item_width - scaled_width) // 2, (item_height - scaled_height) // 2), scaled_font_image)
+
+        img = to_panel_sprite(img)
+        self.item_image_cache[cache_key] = img
+        return img
+
+    def get_clock_image(self):
+        current_time_str = time.strftime("%H:%M:%S")
+        if current_time_str != self.last_time_str:
+            self.last_time_str = current_time_str
+
+            clock_area_width, clock_area_height = CLOCK_SIZE
+            self.clock_image = Image.new("RGBA", (clock_area_width, clock_area_height), (0,0,0,0))
+            clock_draw = ImageDraw.Draw(self.clock_image)
+
+            # Draw a black pop-up box with a blue stroke
+            clock_draw.rectangle((0, 0, clock_area_width-1, clock_area_height-1), fill=(0, 0, 0, 200), outline=(170, 250, 255, 255), width=2)
+            clock_draw.text((40, 10), "History lives in us.", font=self.title_font, fill=(170, 250, 255, 255))
+            clock_draw.text((60, 50), current_time_str, font=self.clock_font, fill=(170, 250, 255, 255))
+            self.clock_image = to_panel_sprite(self.clock_image)
+        return self.clock_image
 
 class NumberMatrixItem:
-    def __init__(self, size, font_path, row_index=0, column_index=0):
+    def __init__(self, sprites, row_index=0, column_index=0):
         self.item_width = 40
         self.item_height = 40
         # Random number from 0-9
         self.number = random.randint(0, 9)
-        self.font_path = font_path
-        self.font = ImageFont.truetype(self.font_path, 20)
+        self.sprites = sprites
         self.shaking_offset = (0, 0)
         self.is_shaking = True
         self.scale = 0.7  # Initial scale is 1.0
         self.row_index = row_index
         self.column_index = column_index
         self.is_collecting = False
-        self.collect_frame_count = 0
+        self.collect_started_at = 0
         
-    def get_collecting_frame_count(self):
-        return self.collect_frame_count
+    def get_collect_elapsed(self, now):
+        return now - self.collect_started_at
         
     def update_scale(self, target_scale, step=0.05):
         if self.scale < target_scale:
@@ -37,15 +157,12 @@ class NumberMatrixItem:
         elif self.scale > target_scale:
             self.scale = max(self.scale - step, target_scale)
         
-    def tick(self, global_collect=False):
-        global is_focused, focus_location, collect_frame_limit
-        if self.is_collecting and self.collect_frame_count < collect_frame_limit:
-            self.collect_frame_count += 1
+    def tick(self, focus_location, now, global_collect=False):
+        if self.is_collecting and self.get_collect_elapsed(now) < COLLECT_DURATION:
             return
         if self.is_collecting:
             self.scale = 0.2
             self.number = random.randint(0, 9)
-            self.collect_frame_count = 0
             self.is_collecting = False
         
         # Calculate the linear distance from the focus position
@@ -59,6 +176,7 @@ class NumberMatrixItem:
             if global_collect:
                 print(f"[Collect] Collecting number {self.number} at ({self.row_index}, {self.column_index})")
                 self.is_collecting = True
+                self.collect_started_at = now
                 self.shaking_offset = (0, 0)
                 self.is_shaking = False
                 return
@@ -74,148 +192,96 @@ class NumberMatrixItem:
             self.shaking_offset = (random.randint(-1, 1), random.randint(-1, 1))
         else:
             self.shaking_offset = (0, 0)
-            
-    def render_font_image(self):
-        global number_image_cache
-        if self.number in number_image_cache:
-            return number_image_cache[self.number]
-        
-        text_bbox = self.font.getbbox(str(self.number))
-        text_width = text_bbox[2] - text_bbox[0]
-        text_height = text_bbox[3] - text_bbox[1]
-        font_image = Image.new("RGBA", (text_width, text_height + 20), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(font_image)
-        draw.text((0, 0), str(self.number), font=self.font, fill=(170, 250, 255, 255))
-        # Cache the font image, key is the number
-        number_image_cache[self.number] = font_image
-        return font_image
 
     def get_item_image(self):
-        global item_image_cache
-        cache_key = (self.number, int(self.scale * 100))
-        if cache_key in item_image_cache:
-            return item_image_cache[cache_key]
+        return self.sprites.get_item_image(self.number, self.scale, self.item_width, self.item_height)
+    
+def get_rotated_lines(top_left, top_right, angle):
+    if angle == 0:
+        return None
+    length = (top_right[0] - top_left[0]) * 0.5
+    left_line_angle = math.radians(angle)
+    right_line_angle = math.radians(angle * -1)
+    left_anchor = (top_left[0], top_left[1])
+    right_anchor = (top_right[0], top_right[1])
+    cos_angle = math.cos(left_line_angle)
+    sin_angle = math.sin(left_line_angle)
+    left_x = left_anchor[0] + length * cos_angle
+    left_y = left_anchor[1] - length * sin_angle
+    cos_angle = math.cos(right_line_angle)
+    sin_angle = math.sin(right_line_angle)
+    right_x = right_anchor[0] - length * cos_angle
+    right_y = right_anchor[1] + length * sin_angle
+    return (top_left, (int(left_x), int(left_y))), (top_right, (int(right_x), int(right_y)))
 
-        img = Image.new("RGBA", (self.item_width, self.item_height), (0, 0, 0, 0))
-        font_image = self.render_font_image()
-        scaled_width = int(font_image.width * self.scale)
-        scaled_height = int(font_image.height * self.scale)
+class BoxOpenItem:
+    def __init__(self, lid_timeline):
+        # Precompiled lid lines per frame, see MdrAnimations
+        self.lid_timeline = lid_timeline
+        self.started_at = None
 
-        if scaled_width == 0 or scaled_height == 0:
-            return img
+    def tick(self, now, show_now=False):
+        if show_now or self.started_at is None:
+            self.started_at = now
 
-        scaled_font_image = font_image.resize((scaled_width, scaled_height), Image.BILINEAR)
-        img.paste(scaled_font_image, ((self.item_width - scaled_width) // 2, (self.item_height - scaled_height) // 2), scaled_font_image)
-        
-        item_image_cache[cache_key] = img
-        return img
-    
-class BoxOpenItem:
-    def __init__(self, top_left, top_right):
-        self.open = True
-        self.top_left = top_left
-        self.top_right = top_right
-        self.angle = 0  # Current angle for rotation
-        self.rotation_speed = 20  # Degrees per frame
-        self.frame = 0
-        self.frame_limit = 30  # Total frames for one open/close cycle
-
-    def update(self):
-        if self.open:
-            if self.frame < 10:
-                if self.angle < 90:
-                    self.angle += self.rotation_speed
-                else:
-                    self.angle = 90
-            elif self.frame >= 20:
-                if self.angle > 0:
-                    self.angle -= self.rotation_speed
-                else:
-                    self.angle = 0
-        else:
-            self.angle = 0
-        
-    def get_rotated_lines(self):
-        length = (self.top_right[0] - self.top_left[0]) * 0.5
-        left_line_angle = math.radians(self.angle)
-        right_line_angle = math.radians(self.angle * -1)
-        left_anchor = (self.top_left[0], self.top_left[1])
-        right_anchor = (self.top_right[0], self.top_right[1])
-        cos_angle = math.cos(left_line_angle)
-        sin_angle = math.sin(left_line_angle)
-        left_x = left_anchor[0] + length * cos_angle
-        left_y = left_anchor[1] - length * sin_angle
-        cos_angle = math.cos(right_line_angle)
-        sin_angle = math.sin(right_line_angle)
-        right_x = right_anchor[0] - length * cos_angle
-        right_y = right_anchor[1] + length * sin_angle
-        return (self.top_left, (int(left_x), int(left_y))), (self.top_right, (int(right_x), int(right_y)))
-    
-    def tick(self, show_now=False):
-        if show_now:
-            self.open = True
-            self.angle = 0
-            self.frame = 0
-        if self.open:
-            if self.frame <= self.frame_limit:
-                self.update()
-                self.frame += 1
-            else:
-                self.angle = 0
-        else:
-            if self.frame > 0:
-                self.angle = max(0, self.angle - self.rotation_speed)
-                self.frame -= 1
-    
-    def set_show(self, show):
-        self.show = show
-        
-    def render(self, draw):
-        if self.angle == 0:
+    def render(self, draw, now):
+        lines = self.lid_timeline.sample(now - self.started_at)
+        if lines is None:
             return
-        left_line, right_line = self.get_rotated_lines()
-        draw.line(left_line, fill=(170, 250, 255, 255), width=2)
-        draw.line(right_line, fill=(170, 250, 255, 255), width=2)
+        left_line, right_line = lines
+        draw.line(left_line, fill=(170, 250, 255, 255), width=1)
+        draw.line(right_line, fill=(170, 250, 255, 255), width=1)
 
-class RenderThread(threading.Thread):
-    def __init__(self, whisplay, font_path, fps=30):
-        super().__init__()
-        self.whisplay = whisplay
-        self.width = whisplay.LCD_HEIGHT
-        self.height = whisplay.LCD_WIDTH
-        self.font_path = font_path
+class MdrAnimations:
+    # Timelines compiled once at startup and shared by every scene, so the
+    # render loop only does table lookups
+    def __init__(self, fps):
         self.fps = fps
-        
-        self.play_start_sound()
-        time.sleep(1.5)
-        
-        self.render_init_screen()
-        self.background_image = self.get_background_image()
-        self.whisplay.set_rgb(170, 250, 255)
-        
-        # Clear the logo and start the loop with running = True
-        self.whisplay.set_rgb_fade(0, 0, 0, duration_ms=1000)
-        self.running = True
-        self.main_text_font = ImageFont.truetype(self.font_path, 20)
-        self.main_text_line_height = self.main_text_font.getmetrics()[0] + self.main_text_font.getmetrics()[1]
-        self.text_cache_image = None
-        self.current_render_text = ""
-        self.frame_count = 0
+        self.lid_timelines = [
+            Timeline(LID_KEYFRAMES, fps=fps).map(partial(get_rotated_lines, top_left, top_right)).map(to_panel_lines)
+            for top_left, top_right in BOX_TOPS
+        ]
+        self.collect_flights = {}
+        x, y = MATRIX_POSITION
+        step = MATRIX_ITEM_SIZE + MATRIX_SPACING
+        for line in range(MATRIX_LINES):
+            for column in range(MATRIX_COLUMNS):
+                for destination_index in range(len(COLLECT_X)):
+                    self.get_collect_flight((x + column * step, y + line * step), destination_index)
+
+    def get_collect_flight(self, start, destination_index):
+        # Scene start position in, panel positions out
+        key = (start, destination_index)
+        if key not in self.collect_flights:
+            destination = (COLLECT_X[destination_index], COLLECT_Y)
+            flight = Timeline([(0, start), (COLLECT_DURATION, destination)], fps=self.fps)
+            self.collect_flights[key] = flight.map(
+                lambda position: to_panel_position((int(position[0]), int(position[1])), (MATRIX_ITEM_SIZE, MATRIX_ITEM_SIZE))
+            )
+        return self.collect_flights[key]
+
+class MdrScene:
+    # Everything that differs between two panels: the number matrix, the
+    # focus point, the bins and the collect/idle state
+    def __init__(self, sprites, animations, background_image):
+        self.sprites = sprites
+        self.animations = animations
+        self.background_image = background_image
+        self.frame = Image.new("RGBA", PANEL_SIZE, (0, 0, 0, 255))
+        # create a 12 x 6 matrix of NumberMatrixItem
+        self.matrix_items = []
+        for i in range(MATRIX_LINES):
+            row = []
+            for j in range(MATRIX_COLUMNS):
+                row.append(NumberMatrixItem(sprites, row_index=j, column_index=i))
+            self.matrix_items.append(row)
+        self.box_items = [BoxOpenItem(lid_timeline) for lid_timeline in animations.lid_timelines]
+        self.is_focused = True
+        self.focus_location = (random.randint(0, 11), random.randint(0, 5))  # Initial focus position
         self.collecting = False
         self.collect_destination_index = 0
-        self.collect_destination = (50, 380)  # Default collection position
         self.idle_countdown = 100
         self.show_time = True
-        
-        # Optimization: Pre-create canvases
-        self.canvas = Image.new("RGBA", (self.width * 2, self.height * 2), (0, 0, 0, 0))
-        self.final_image = Image.new("RGBA", (self.whisplay.LCD_WIDTH, self.whisplay.LCD_HEIGHT), (0, 0, 0, 255))
-        
-        # Optimization: Cache for clock
-        self.last_time_str = ""
-        self.clock_image = None
-        self.clock_font = ImageFont.truetype(self.font_path, 60)
-        self.title_font = ImageFont.truetype(self.font_path, 32)
 
     def set_collecting(self, collecting):
         self.idle_countdown = 100
@@ -223,192 +289,312 @@ class RenderThread(threading.Thread):
         self.collecting = collecting
         print(f"[Collect] Set collecting to {collecting}")
         if collecting:
-            self.collect_destination_index = random.randint(0, 4)
-            collect_x = [50, 150, 260, 370, 480][self.collect_destination_index]
-            self.collect_destination = (collect_x, 380)
-            
-    def play_start_sound(self):
-        start_sound_path = os.path.join("sound", "computer_start.mp3")
-        if os.path.exists(start_sound_path):
-            pygame.mixer.Sound(start_sound_path).play()
+            self.collect_destination_index = random.randint(0, len(COLLECT_X) - 1)
 
-    def render_init_screen(self):
-        # Display logo on startup with animation
-        logo_path = os.path.join("img", "lumon_logo.jpg")
-        if os.path.exists(logo_path):
-            logo_image = Image.open(logo_path).convert("RGBA")
-            logo_image = logo_image.resize((whisplay.LCD_WIDTH, whisplay.LCD_HEIGHT), Image.BILINEAR)
-
-            animation_duration = 2  # seconds
-            num_frames = int(animation_duration * self.fps)
-            start_y = whisplay.LCD_HEIGHT
-            end_y = 0
-            
-            background = Image.new("RGBA", (whisplay.LCD_WIDTH, whisplay.LCD_HEIGHT), (0, 0, 0, 255))
-            
-            whisplay.set_backlight(100)
+    # generate a random is_focused and location
+    def random_focus_location(self):
+        seed = random.randint(0, 10)
+        if seed > 3:
+            self.is_focused = random.choice([True, False])
+        else:
+            self.is_focused = True
+        self.focus_location = (random.randint(0, 11), random.randint(0, 5))
+        print(f"[Focus] is_focused: {self.is_focused}, location: {self.focus_location}")
 
-            for i in range(num_frames + 1):
-                progress = i / num_frames
-                # Ease-out effect
-                progress = 1 - (1 - progress) ** 3
-                
-                current_y = int(start_y + (end_y - start_y) * progress)
-                
-                frame = background.copy()
-                frame.paste(logo_image, (0, current_y), logo_image)
-                
-                rgb565_data = ImageUtils.image_to_rgb565(frame, whisplay.LCD_WIDTH, whisplay.LCD_HEIGHT)
-                whisplay.draw_image(0, 0, whisplay.LCD_WIDTH, whisplay.LCD_HEIGHT, rgb565_data)
-                time.sleep(1 / self.fps)
-            
-    def get_background_image(self):
-        bg_path = os.path.join("img", "mdr_bg.jpg")
-        if os.path.exists(bg_path):
-            bg_image = Image.open(bg_path).convert("RGBA")
-            bg_image = bg_image.resize((self.whisplay.LCD_HEIGHT, self.whisplay.LCD_WIDTH), Image.BILINEAR)
-            bg_image = bg_image.rotate(-90, expand=True)
-            return bg_image
-        return None
+    def tick(self, frame_count, fps):
+        if self.idle_countdown > 0:
+            self.idle_countdown -= 1
+        else:
+            self.show_time = True
+        if frame_count % (2 * fps) == 0:  # Randomize the focus position once
+            self.random_focus_location()
 
-    def render_frame(self):
-        # Optimization: clear canvas instead of creating a new one
-        self.canvas.paste((0, 0, 0, 0), (0, 0, self.canvas.width, self.canvas.height))
-        draw = ImageDraw.Draw(self.canvas)
+    def render(self, now):
+        # Draw straight into the panel frame, starting from the background
+        if self.background_image:
+            self.frame.paste(self.background_image, (0, 0))
+        else:
+            self.frame.paste((0, 0, 0, 255), (0, 0, self.frame.width, self.frame.height))
+        draw = ImageDraw.Draw(self.frame)
 
         temp_collecting = self.collecting
         temp_collect_destination_index = self.collect_destination_index
         if self.collecting:
             self.collecting = False
-        self.render_number_matrix(self.canvas, (24, 106), 12, 6, 40, 40, 4, (170, 250, 255, 255), temp_collecting)
+        self.render_number_matrix(self.frame, now, MATRIX_POSITION, MATRIX_COLUMNS, MATRIX_LINES, MATRIX_ITEM_SIZE, MATRIX_ITEM_SIZE, MATRIX_SPACING, (170, 250, 255, 255), temp_collecting)
 
-        self.render_box_open(draw, temp_collecting, temp_collect_destination_index)
+        self.render_box_open(draw, now, temp_collecting, temp_collect_destination_index)
 
         if self.show_time:
-            current_time_str = time.strftime("%H:%M:%S")
-            if current_time_str != self.last_time_str:
-                self.last_time_str = current_time_str
-                
-                clock_area_width = 370
-                clock_area_height = 150
-                self.clock_image = Image.new("RGBA", (clock_area_width, clock_area_height), (0,0,0,0))
-                clock_draw = ImageDraw.Draw(self.clock_image)
-                
-                # Draw a black pop-up box with a blue stroke
-                clock_draw.rectangle((0, 0, clock_area_width-1, clock_area_height-1), fill=(0, 0, 0, 200), outline=(170, 250, 255, 255), width=2)
-                clock_draw.text((40, 10), "History lives in us.", font=self.title_font, fill=(170, 250, 255, 255))
-                clock_draw.text((60, 50), current_time_str, font=self.clock_font, fill=(170, 250, 255, 255))
-
-            if self.clock_image:
-                self.canvas.paste(self.clock_image, (100, 170), self.clock_image)
+            clock_image = self.sprites.get_clock_image()
+            if clock_image:
+                self.frame.paste(clock_image, to_panel_position(CLOCK_POSITION, CLOCK_SIZE), clock_image)
+        return self.frame
 
-        rotated = self.canvas.rotate(-90, expand=True)
-        resized = rotated.resize((self.whisplay.LCD_WIDTH, self.whisplay.LCD_HEIGHT), Image.BILINEAR)
-        
-        # Optimization: reuse final_image
-        self.final_image.paste(self.background_image, (0, 0), self.background_image)
-        self.final_image.paste(resized, (0, 0), resized)
-        
-        self.whisplay.draw_image(0, 0, self.whisplay.LCD_WIDTH, self.whisplay.LCD_HEIGHT, ImageUtils.image_to_rgb565(self.final_image, self.whisplay.LCD_WIDTH, self.whisplay.LCD_HEIGHT))
-        
-    def render_box_open(self, draw, collecting, destination_index):
-        for i, box in enumerate(box_items):
-            box.tick(collecting and i == destination_index)
-            box.render(draw)
+    def render_box_open(self, draw, now, collecting, destination_index):
+        for i, box in enumerate(self.box_items):
+            box.tick(now, collecting and i == destination_index)
+            box.render(draw, now)
 
-    def render_number_matrix(self, image, position, column_count, line_count, item_width, item_height, spacing, font_color, global_collect=False):
-        global collect_frame_limit
+    def render_number_matrix(self, image, now, position, column_count, line_count, item_width, item_height, spacing, font_color, global_collect=False):
         if global_collect:
             print(f"[Render] Rendering number matrix with collect={global_collect}")
         # Plan the width, height, and spacing of the item, the text needs to be rendered in the center of the item
         x, y = position
         for line in range(line_count):
             for column in range(column_count):
-                item = matrix_items[line][column]
-                item.tick(global_collect)
+                item = self.matrix_items[line][column]
+                item.tick(self.focus_location, now, global_collect)
                 item_image = item.get_item_image()
-                item_x = x + column * (item_width + spacing) + item.shaking_offset[0]
-                item_y = y + line * (item_height + spacing) + item.shaking_offset[1]
+                item_x = x + column * (item_width + spacing)
+                item_y = y + line * (item_height + spacing)
                 
-                if item.get_collecting_frame_count() > 0:
-                    dest_x, dest_y = self.collect_destination
-                    progress = item.get_collecting_frame_count() / collect_frame_limit
-                    item_x = int(item_x + (dest_x - item_x) * progress)
-                    item_y = int(item_y + (dest_y - item_y) * progress)
-                image.paste(item_image, (item_x, item_y), item_image)
+                if item.is_collecting:
+                    flight = self.animations.get_collect_flight((item_x, item_y), self.collect_destination_index)
+                    panel_position = flight.sample(item.get_collect_elapsed(now))
+                else:
+                    item_position = (item_x + item.shaking_offset[0], item_y + item.shaking_offset[1])
+                    panel_position = to_panel_position(item_position, (item_width, item_height))
+                image.paste(item_image, panel_position, item_image)
+
+class FramePipeline:
+    # Panel frame conversion shared by all panels: the background is loaded
+    # and rotated into panel orientation once
+    def __init__(self, lcd_width, lcd_height):
+        self.lcd_width = lcd_width
+        self.lcd_height = lcd_height
+        self.background_image = self.get_background_image()
+
+    def get_background_image(self):
+        bg_path = os.path.join("img", "mdr_bg.jpg")
+        if os.path.exists(bg_path):
+            bg_image = Image.open(bg_path).convert("RGBA")
+            bg_image = bg_image.resize((self.lcd_height, self.lcd_width), Image.BILINEAR)
+            bg_image = bg_image.rotate(-90, expand=True)
+            return bg_image
+        return None
+
+    def to_rgb565(self, image):
+        return ImageUtils.image_to_rgb565(image, self.lcd_width, self.lcd_height)
+
+class RenderThread(threading.Thread):
+    # Drives one or more displays. A display only needs LCD_WIDTH,
+    # LCD_HEIGHT, draw_image, set_backlight, set_rgb and set_rgb_fade, so a
+    # stand-in backend can replace WhisplayBoard when testing. The startup
+    # sound and logo play from run(), render_frame() can be driven directly
+    def __init__(self, displays, sprites, audio, fps=30):
+        super().__init__()
+        self.displays = list(displays)
+        if not self.displays:
+            raise ValueError("At least one display is required")
+        for display in self.displays:
+            if (display.LCD_WIDTH, display.LCD_HEIGHT) != PANEL_SIZE:
+                raise ValueError(f"The MDR scene is laid out for {PANEL_SIZE[0]}x{PANEL_SIZE[1]} panels")
+        self.lcd_width, self.lcd_height = PANEL_SIZE
+        self.sprites = sprites
+        self.audio = audio
+        self.fps = fps
+        self.pipeline = FramePipeline(self.lcd_width, self.lcd_height)
+        # One worker per panel so SPI transfers to different panels overlap
+        self.executor = ThreadPoolExecutor(max_workers=len(self.displays))
+        self.running = True
+        self.frame_count = 0
+        self.frame_time_total = 0
+        self.animations = MdrAnimations(fps)
+        self.scenes = [MdrScene(sprites, self.animations, self.pipeline.background_image) for _ in self.displays]
+
+    def play_intro(self):
+        self.play_start_sound()
+        time.sleep(1.5)
+        
+        self.render_init_screen()
+        self.for_each_display(lambda display: display.set_rgb(170, 250, 255))
         
+        # Clear the logo and start the loop
+        self.for_each_display(lambda display: display.set_rgb_fade(0, 0, 0, duration_ms=1000))
+
+    def for_each_display(self, func):
+        if len(self.displays) == 1:
+            func(self.displays[0])
+            return
+        # list() waits for every panel and re-raises the first error
+        list(self.executor.map(func, self.displays))
+
+    def transmit(self, frames):
+        if len(self.displays) == 1:
+            self.displays[0].draw_image(0, 0, self.lcd_width, self.lcd_height, frames[0])
+            return
+        futures = [
+            self.executor.submit(display.draw_image, 0, 0, self.lcd_width, self.lcd_height, rgb565_data)
+            for display, rgb565_data in zip(self.displays, frames)
+        ]
+        for future in futures:
+            future.result()
+
+    def set_collecting(self, collecting):
+        for scene in self.scenes:
+            scene.set_collecting(collecting)
+
+    def random_focus_location(self):
+        for scene in self.scenes:
+            scene.random_focus_location()
+            
+    def play_start_sound(self):
+        self.audio.play("start")
+
+    def render_init_screen(self):
+        # Display logo on startup with animation
+        logo_path = os.path.join("img", "lumon_logo.jpg")
+        if os.path.exists(logo_path):
+            logo_image = Image.open(logo_path).convert("RGBA")
+            logo_image = logo_image.resize((self.lcd_width, self.lcd_height), Image.BILINEAR)
+
+            # Ease-out slide from below the screen to the top
+            logo_slide = Timeline(
+                [(0, self.lcd_height), (LOGO_SLIDE_DURATION, 0)], fps=self.fps, easing=ease_out_cubic
+            ).map(int)
+            
+            frame = Image.new("RGBA", (self.lcd_width, self.lcd_height), (0, 0, 0, 255))
+            
+            self.for_each_display(lambda display: display.set_backlight(100))
+
+            start_time = time.monotonic()
+            while True:
+                elapsed = time.monotonic() - start_time
+                frame.paste((0, 0, 0, 255), (0, 0, self.lcd_width, self.lcd_height))
+                frame.paste(logo_image, (0, logo_slide.sample(elapsed)), logo_image)
+                
+                # Every panel shows the same logo, convert once and send to all
+                rgb565_data = self.pipeline.to_rgb565(frame)
+                self.transmit([rgb565_data] * len(self.displays))
+                if logo_slide.is_finished(elapsed):
+                    break
+                time.sleep(1 / self.fps)
+
+    def render_frame(self):
+        # Monotonic, a Pi has no RTC and its wall clock jumps when NTP syncs
+        now = time.monotonic()
+        frames = [self.pipeline.to_rgb565(scene.render(now)) for scene in self.scenes]
+        self.transmit(frames)
 
     def run(self):
-        global is_focused, focus_location
         frame_interval = 1 / self.fps
-        while self.running:
-            self.render_frame()
-            self.frame_count += 1
-            if self.idle_countdown > 0:
-                self.idle_countdown -= 1
-            else:
-                self.show_time = True
-            if self.frame_count % (2 * self.fps) == 0:  # Randomize the focus position once
-                random_focus_location()
-            time.sleep(frame_interval)
+        try:
+            self.play_intro()
+            while self.running:
+                frame_start = time.monotonic()
+                self.render_frame()
+                self.frame_time_total += time.monotonic() - frame_start
+                self.frame_count += 1
+                for scene in self.scenes:
+                    scene.tick(self.frame_count, self.fps)
+                if self.frame_count % (10 * self.fps) == 0:
+                    average_ms = self.frame_time_total / (10 * self.fps) * 1000
+                    print(f"[Render] {len(self.displays)} panel(s), average frame time {average_ms:.1f} ms")
+                    self.frame_time_total = 0
+                time.sleep(frame_interval)
+        finally:
+            self.executor.shutdown(wait=True)
             
     def stop(self):
         self.running = False
         
-pygame.mixer.init()
-number_image_cache = {}
-item_image_cache = {}
-    
-# create a 12 x 6 matrix of NumberMatrixItem
-matrix_items = []
-for i in range(6):
-    row = []
-    for j in range(12):
-        item = NumberMatrixItem((20, 20), "NotoSansSC-Bold.ttf", row_index=j, column_index=i)
-        row.append(item)
-    matrix_items.append(row)
-    
-is_focused = True
-focus_location = (random.randint(0, 11), random.randint(0, 5))  # Initial focus position
-# 50 150 260 370 480
-collect_frame_limit = 10
-
-click_sound_effect = pygame.mixer.Sound(os.path.join("sound", "click_sound.mp3"))
-click_sound_effect.set_volume(0.1)
-
 # Button hold to restart render process
 restart_hold_seconds = 5
 
-box_tops = [
-    [(20, 400), (103, 400)],
-    [(130, 400), (212, 400)],
-    [(238, 403), (320, 403)],
-    [(348, 400), (430, 400)],
-    [(457, 400), (540, 400)],
-]
-box_items = [BoxOpenItem(top_left, top_right) for top_left, top_right in box_tops]
-
-def play_click_sound():
-    if not pygame.mixer.music.get_busy():
-        click_sound_effect.play()
-
-# generate a random is_focused and location
-def random_focus_location():
-    global focus_location, is_focused
-    seed = random.randint(0, 10)
-    if seed > 3:
-        is_focused = random.choice([True, False])
-    else:
-        is_focused = True
-    focus_location = (random.randint(0, 11), random.randint(0, 5))
-    print(f"[Focus] is_focused: {is_focused}, location: {focus_location}")
+def parse_panel(spec):
+    # "BUS,DEVICE" or "BUS,DEVICE,DC,RST,LED" (physical pin numbers)
+    values = [int(value) for value in spec.split(",")]
+    if len(values) not in (2, 5):
+        raise argparse.ArgumentTypeError(f"Invalid panel spec: {spec}")
+    panel = {"spi_bus": values[0], "spi_device": values[1]}
+    if len(values) == 5:
+        panel.update(dc_pin=values[2], rst_pin=values[3], led_pin=values[4])
+    return panel
     
 if __name__ == "__main__":
-    whisplay = WhisplayBoard()
+    from whisplay import WhisplayBoard
+
+    parser = argparse.ArgumentParser(description="Lumon MDR UI for Whisplay")
+    parser.add_argument(
+        "--panel",
+        action="append",
+        type=parse_panel,
+        metavar="BUS,DEVICE[,DC,RST,LED]",
+        help="SPI bus/device and DC/RST/LED pins of a panel, repeat for more panels. "
+        "Only the first panel may omit the pins and use the Whisplay HAT defaults",
+    )
+    parser.add_argument("--fps", type=int, default=30)
+    parser.add_argument(
+        "--stream",
+        metavar="ADDRESS",
+        help="Stream the screen to a viewer on HOST:PORT or a Unix socket path, extra panels use the next port / ADDRESS.N",
+    )
+    parser.add_argument("--stream-no-zlib", action="store_true", help="Send stream tiles uncompressed")
+    parser.add_argument("--audio-buffer", type=int, default=256, help="Mixer buffer size in samples, raise it if audio crackles")
+    args = parser.parse_args()
+
+    panels = args.panel or [{}]
+
+    def check_panel_pins(panels):
+        # Every panel needs its own SPI device and DC/RST/LED lines: a shared
+        # RST resets the other panel, and a shared DC mixes up the command and
+        # data bytes of concurrent transfers
+        used_devices = set()
+        used_pins = {}
+        for index, panel in enumerate(panels):
+            if index > 0 and "dc_pin" not in panel:
+                raise ValueError(f"Panel {index + 1} needs its own pins: BUS,DEVICE,DC,RST,LED")
+            device = (panel.get("spi_bus", 0), panel.get("spi_device", 0))
+            if device in used_devices:
+                raise ValueError(f"spi{device[0]}.{device[1]} is used by more than one panel")
+            used_devices.add(device)
+            pins = [
+                panel.get("dc_pin", WhisplayBoard.DC_PIN),
+                panel.get("rst_pin", WhisplayBoard.RST_PIN),
+                panel.get("led_pin", WhisplayBoard.LED_PIN),
+            ]
+            if index == 0:
+                pins += [WhisplayBoard.RED_PIN, WhisplayBoard.GREEN_PIN, WhisplayBoard.BLUE_PIN, WhisplayBoard.BUTTON_PIN]
+            for pin in pins:
+                if pin in used_pins:
+                    raise ValueError(f"Pin {pin} is assigned twice (panel {used_pins[pin]} and panel {index + 1})")
+                used_pins[pin] = index + 1
+
+    try:
+        check_panel_pins(panels)
+    except ValueError as e:
+        parser.error(str(e))
+
+    # Only the first panel owns the RGB LED and the button
+    displays = [WhisplayBoard(**panels[0])]
+    for panel in panels[1:]:
+        displays.append(WhisplayBoard(rgb_pins=None, button_pin=None, **panel))
+    whisplay = displays[0]
     
-    print(f"[LCD] initial finish: {whisplay.LCD_WIDTH}x{whisplay.LCD_HEIGHT}")
+    streamers = []
+    if args.stream:
+        for index, display in enumerate(displays):
+            address = args.stream
+            if index > 0:
+                host, separator, port = address.rpartition(":")
+                address = f"{host}:{int(port) + index}" if separator and port.isdigit() else f"{address}.{index}"
+            try:
+                streamer = FrameStreamer(address, display.LCD_WIDTH, display.LCD_HEIGHT, compress=not args.stream_no_zlib)
+            except (ValueError, OSError) as e:
+                parser.error(f"--stream {address}: {e}")
+            display.set_frame_sink(streamer)
+            streamers.append(streamer)
+
+    for display in displays:
+        print(f"[LCD] initial finish: spi{display.spi_bus}.{display.spi_device} {display.LCD_WIDTH}x{display.LCD_HEIGHT}")
     
-    render_thread = RenderThread(whisplay, "NotoSansSC-Bold.ttf", fps=30)
+    audio = AudioPlayer(buffer=args.audio_buffer)
+    audio.load("start", os.path.join("sound", "computer_start.mp3"))
+    audio.load("click", os.path.join("sound", "click_sound.mp3"), volume=0.1)
+
+    sprites = SpriteCache(FONT_PATH)
+    render_thread = RenderThread(displays, sprites, audio, fps=args.fps)
     render_thread.start()
 
     button_press_time = 0
@@ -421,7 +607,7 @@ if __name__ == "__main__":
             render_thread.stop()
             render_thread.join()
             
-        render_thread = RenderThread(whisplay, "NotoSansSC-Bold.ttf", fps=30)
+        render_thread = RenderThread(displays, sprites, audio, fps=args.fps)
         render_thread.start()
 
     def hold_check():
@@ -456,15 +642,14 @@ if __name__ == "__main__":
 
     def button_release_handler():
         global button_press_time
+        released_at = time.perf_counter()
         # button press status
         print("Button pressed status:", whisplay.button_pressed())
         if time.time() - button_press_time < restart_hold_seconds:
             render_thread.set_collecting(True)
-            # 一秒后更新focus位置
-            # random_focus_location()
-            play_click_sound()
-            time.sleep(1)
-            random_focus_location()
+            audio.play_click("click", released_at)
+            # 一秒后更新focus位置，不阻塞按键回调
+            threading.Timer(1, render_thread.random_focus_location).start()
     
     whisplay.on_button_press(button_press_handler)
     whisplay.on_button_release(button_release_handler)
@@ -474,7 +659,11 @@ if __name__ == "__main__":
         if render_thread and render_thread.is_alive():
             render_thread.stop()
             render_thread.join()
-        whisplay.cleanup()
+        for streamer in streamers:
+            streamer.stop()
+        for display in displays:
+            display.cleanup()
+        audio.stop()
         sys.exit(0)
 
     signal.signal(signal.SIGTERM, cleanup_and_exit)
@@ -0,0 +1,105 @@
+import argparse
+import socket
+import threading
+import time
+
+import numpy as np
+import pygame
+
+from frame_stream import FrameStreamDecoder, parse_address
+
+
+class FrameReader(threading.Thread):
+    # Reads frames off the socket so the window keeps handling events while
+    # the stream is idle (the unit sends nothing when the screen is static)
+    def __init__(self, decoder):
+        super().__init__(daemon=True)
+        self.decoder = decoder
+        self.lock = threading.Lock()
+        self.rgb = None
+        self.bytes_received = 0
+        self.frames_received = 0
+        self.closed = False
+
+    def run(self):
+        try:
+            while True:
+                _, _, size = self.decoder.read_frame()
+                rgb = self.decoder.to_rgb()
+                with self.lock:
+                    self.rgb = rgb
+                    self.bytes_received += size
+                    self.frames_received += 1
+        except (ConnectionError, OSError):
+            self.closed = True
+
+    def take(self):
+        # Latest frame (None when nothing new) and the counters since last call
+        with self.lock:
+            rgb, self.rgb = self.rgb, None
+            stats = (self.bytes_received, self.frames_received)
+            self.bytes_received = 0
+            self.frames_received = 0
+        return rgb, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="View the screen of a unit started with --stream")
+    parser.add_argument("address", help="HOST:PORT or Unix socket path")
+    parser.add_argument("--scale", type=int, default=2)
+    parser.add_argument("--rotate", type=int, default=90, help="Counterclockwise rotation in degrees, 90 shows the MDR UI upright")
+    args = parser.parse_args()
+
+    family, address = parse_address(args.address)
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.connect(address)
+    decoder = FrameStreamDecoder(sock)
+    print(f"[Viewer] Connected to {args.address}: {decoder.width}x{decoder.height}")
+
+    reader = FrameReader(decoder)
+    reader.start()
+
+    pygame.init()
+    clock = pygame.time.Clock()
+    screen = None
+    bytes_received = 0
+    frames_received = 0
+    stats_started = time.time()
+
+    try:
+        while True:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    return
+            if reader.closed:
+                print("[Viewer] Stream closed")
+                return
+
+            rgb, (frame_bytes, frame_count) = reader.take()
+            bytes_received += frame_bytes
+            frames_received += frame_count
+            if rgb is not None:
+                rgb = np.rot90(rgb, args.rotate // 90)
+                surface = pygame.surfarray.make_surface(rgb.swapaxes(0, 1))
+                surface = pygame.transform.scale(surface, (surface.get_width() * args.scale, surface.get_height() * args.scale))
+                if screen is None:
+                    screen = pygame.display.set_mode(surface.get_size())
+                screen.blit(surface, (0, 0))
+                pygame.display.flip()
+
+            elapsed = time.time() - stats_started
+            if elapsed >= 1:
+                pygame.display.set_caption(
+                    f"Whisplay {args.address} - {bytes_received / elapsed / 1024:.1f} KB/s, {frames_received / elapsed:.1f} fps"
+                )
+                bytes_received = 0
+                frames_received = 0
+                stats_started = time.time()
+            clock.tick(60)
+    finally:
+        sock.close()
+        pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import copy
+
+
+# Easing curves, evaluated only while a timeline is compiled
+def linear(progress):
+    return progress
+
+
+def ease_out_cubic(progress):
+    return 1 - (1 - progress) ** 3
+
+
+def _lerp(start, end, progress):
+    if isinstance(start, tuple):
+        return tuple(_lerp(a, b, progress) for a, b in zip(start, end))
+    return start + (end - start) * progress
+
+
+class Timeline:
+    # An animation declared as keyframes [(seconds, value), ...] and
+    # precompiled into one lookup table entry per frame. Values can be
+    # numbers or tuples of numbers (e.g. positions). Sampling is a clamped
+    # table lookup, so no easing or interpolation runs in the render loop.
+    def __init__(self, keyframes, fps=30, easing=linear):
+        if not keyframes:
+            raise ValueError("Timeline needs at least one keyframe")
+        self.keyframes = sorted(keyframes, key=lambda keyframe: keyframe[0])
+        self.fps = fps
+        self.duration = self.keyframes[-1][0]
+        frame_total = max(1, int(round(self.duration * fps)))
+        self.table = [self._interpolate(i / fps, easing) for i in range(frame_total + 1)]
+
+    def _interpolate(self, elapsed, easing):
+        previous_time, previous_value = self.keyframes[0]
+        if elapsed <= previous_time:
+            return previous_value
+        for keyframe_time, keyframe_value in self.keyframes[1:]:
+            if elapsed <= keyframe_time:
+                span = keyframe_time - previous_time
+                progress = (elapsed - previous_time) / span if span > 0 else 1
+                return _lerp(previous_value, keyframe_value, easing(progress))
+            previous_time, previous_value = keyframe_time, keyframe_value
+        return previous_value
+
+    def map(self, func):
+        # Precompile a derived table, e.g. angles into line endpoints
+        mapped = copy.copy(self)
+        mapped.table = [func(value) for value in self.table]
+        return mapped
+
+    def sample(self, elapsed):
+        index = int(elapsed * self.fps)
+        if index <= 0:
+            return self.table[0]
+        if index >= len(self.table):
+            return self.table[-1]
+        return self.table[index]
+
+    def is_finished(self, elapsed):
+        return elapsed >= self.duration
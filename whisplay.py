@@ -20,7 +20,27 @@ class WhisplayBoard:
     # 按键引脚
     BUTTON_PIN = 11
 
-    def __init__(self):
+    def __init__(
+        self,
+        spi_bus=0,
+        spi_device=0,
+        dc_pin=DC_PIN,
+        rst_pin=RST_PIN,
+        led_pin=LED_PIN,
+        rgb_pins=(RED_PIN, GREEN_PIN, BLUE_PIN),
+        button_pin=BUTTON_PIN,
+    ):
+        # 多块屏幕共用一个进程时，每块屏幕使用独立的 SPI 设备和引脚；
+        # rgb_pins / button_pin 传 None 表示该屏幕不接 RGB 灯或按键
+        self.DC_PIN = dc_pin
+        self.RST_PIN = rst_pin
+        self.LED_PIN = led_pin
+        self.BUTTON_PIN = button_pin
+        self.has_rgb = rgb_pins is not None
+        if self.has_rgb:
+            self.RED_PIN, self.GREEN_PIN, self.BLUE_PIN = rgb_pins
+        self._pins = [dc_pin, rst_pin, led_pin]
+
         GPIO.setmode(GPIO.BOARD)
         GPIO.setwarnings(False)
 
@@ -36,32 +56,40 @@ class WhisplayBoard:
         self.backlight_pwm.start(100)
 
         # 初始化 RGB LED 引脚
-        GPIO.setup([self.RED_PIN, self.GREEN_PIN, self.BLUE_PIN], GPIO.OUT)
-        self.red_pwm = GPIO.PWM(self.RED_PIN, 100)
-        self.green_pwm = GPIO.PWM(self.GREEN_PIN, 100)
-        self.blue_pwm = GPIO.PWM(self.BLUE_PIN, 100)
         self._current_r = 0
         self._current_g = 0
         self._current_b = 0
-        self.red_pwm.start(0)
-        self.green_pwm.start(0)
-        self.blue_pwm.start(0)
+        if self.has_rgb:
+            GPIO.setup([self.RED_PIN, self.GREEN_PIN, self.BLUE_PIN], GPIO.OUT)
+            self.red_pwm = GPIO.PWM(self.RED_PIN, 100)
+            self.green_pwm = GPIO.PWM(self.GREEN_PIN, 100)
+            self.blue_pwm = GPIO.PWM(self.BLUE_PIN, 100)
+            self.red_pwm.start(0)
+            self.green_pwm.start(0)
+            self.blue_pwm.start(0)
+            self._pins.extend([self.RED_PIN, self.GREEN_PIN, self.BLUE_PIN])
 
         # 初始化按键
-        GPIO.setup(self.BUTTON_PIN, GPIO.IN, pull_up_down=GPIO.PUD_UP)
         self.button_press_callback = None
         self.button_release_callback = None
-        GPIO.add_event_detect(
-            self.BUTTON_PIN, GPIO.BOTH, callback=self._button_event, bouncetime=50
-        )
+        if self.BUTTON_PIN is not None:
+            GPIO.setup(self.BUTTON_PIN, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+            GPIO.add_event_detect(
+                self.BUTTON_PIN, GPIO.BOTH, callback=self._button_event, bouncetime=50
+            )
+            self._pins.append(self.BUTTON_PIN)
 
         # 初始化 SPI
+        self.spi_bus = spi_bus
+        self.spi_device = spi_device
         self.spi = spidev.SpiDev()
-        self.spi.open(0, 0)
+        self.spi.open(spi_bus, spi_device)
         self.spi.max_speed_hz = 100_000_000
         self.spi.mode = 0b00
 
         self.previous_frame = None
+        # 可选的帧输出（例如远程监看），draw_image 每帧都会交给它
+        self.frame_sink = None
         self._reset_lcd()
         self._init_display()
         self.fill_screen(0)
@@ -199,9 +227,16 @@ class WhisplayBoard:
             raise ValueError("图像尺寸超出屏幕范围")
         self.set_window(x, y, x + width - 1, y + height - 1)
         self._send_data(pixel_data)
+        if self.frame_sink:
+            self.frame_sink.submit(x, y, width, height, pixel_data)
+
+    def set_frame_sink(self, sink):
+        self.frame_sink = sink
 
     # ========== RGB 与按键 ==========
     def set_rgb(self, r, g, b):
+        if not self.has_rgb:
+            return
         self.red_pwm.ChangeDutyCycle(100 - (r / 255 * 100))
         self.green_pwm.ChangeDutyCycle(100 - (g / 255 * 100))
         self.blue_pwm.ChangeDutyCycle(100 - (b / 255 * 100))
@@ -210,6 +245,8 @@ class WhisplayBoard:
         self._current_b = b
 
     def set_rgb_fade(self, r_target, g_target, b_target, duration_ms=100):
+        if not self.has_rgb:
+            return
         steps = 20  # 可以调整步数来控制渐变的平滑度
         delay_ms = duration_ms / steps
 
@@ -229,6 +266,8 @@ class WhisplayBoard:
             time.sleep(delay_ms / 1000.0)
 
     def button_pressed(self):
+        if self.BUTTON_PIN is None:
+            return False
         return GPIO.input(self.BUTTON_PIN) == 1
 
     def on_button_press(self, callback):
@@ -257,7 +296,10 @@ class WhisplayBoard:
     # ========== 清理 ==========
     def cleanup(self):
         self.spi.close()
-        self.red_pwm.stop()
-        self.green_pwm.stop()
-        self.blue_pwm.stop()
-        GPIO.cleanup()
\ No newline at end of file
+        self.backlight_pwm.stop()
+        if self.has_rgb:
+            self.red_pwm.stop()
+            self.green_pwm.stop()
+            self.blue_pwm.stop()
+        # 只释放本屏幕占用的引脚，避免影响同一进程中的其他屏幕
+        GPIO.cleanup(self._pins)